@@ -7,16 +7,42 @@ authentication, data retrieval, and data manipulation.
 
 from __future__ import annotations
 
-from functools import cached_property
+import sys
+import time
+from dataclasses import fields
 from typing import Literal, Union
-from urllib.parse import urljoin
 
 import requests
 from requests import HTTPError, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
-from keystone_client.schema import Endpoint, Schema
+from keystone_client.schema import Schema
+
+try:  # Use the faster orjson parser for API responses when it is installed
+    import orjson
+
+except ImportError:  # pragma: no cover
+    orjson = None
 
 DEFAULT_TIMEOUT = 15
+DEFAULT_POOL_SIZE = 10
+DEFAULT_AUTH_CACHE_TTL = 30
+DEFAULT_VERSION_CACHE_TTL = 300
+MAX_RETRY_AFTER = 5
+
+
+class _CappedRetry(Retry):
+    """Retry policy limiting how long a server may delay retries via `Retry-After`."""
+
+    def get_retry_after(self, response) -> float | None:
+        """Return the server requested retry delay, capped at `MAX_RETRY_AFTER` seconds."""
+
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+
+        return min(retry_after, MAX_RETRY_AFTER)
 
 
 class HTTPClient:
@@ -24,15 +50,80 @@ class HTTPClient:
 
     schema = Schema()
 
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        auth_cache_ttl: float = DEFAULT_AUTH_CACHE_TTL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        session: Session | None = None
+    ) -> None:
         """Initialize the class.
 
         Args:
             url: The base URL for a Keystone API server.
+            auth_cache_ttl: Seconds to cache successful authentication checks (`0` to disable).
+            pool_size: Maximum number of keep-alive connections to maintain with the server.
+            session: Optional preconfigured session to send requests with (`pool_size` is ignored when given).
         """
 
         self._url = url.rstrip('/') + '/'
-        self._session = Session()
+        self._auth_cache_ttl = auth_cache_ttl
+
+        # Authentication URLs never change for the lifetime of a client
+        self._login_url = self.schema.login.join_url(self._url)
+        self._logout_url = self.schema.logout.join_url(self._url)
+        self._whoami_url = self.schema.whoami.join_url(self._url)
+
+        # Data endpoint URLs are resolved once and reused by the CRUD methods
+        self._collection_urls = {
+            field.name: getattr(self.schema, field.name).join_url(self._url) for field in fields(self.schema)
+        }
+
+        # User provided sessions are used as is and left open when the client is closed
+        self._owns_session = session is None
+        self._session = session if session is not None else self._create_session(pool_size)
+
+        self._csrf_token = None
+        self._csrf_header = {}
+        self._auth_valid_until = 0.0
+
+    @staticmethod
+    def _create_session(pool_size: int) -> Session:
+        """Create a new session backed by a retrying connection pool.
+
+        Args:
+            pool_size: Maximum number of keep-alive connections to maintain with the server.
+
+        Returns:
+            A new session instance.
+        """
+
+        # Share a single connection pool across all requests (including authentication)
+        # so keep-alive connections are reused instead of renegotiated per call.
+        # Rate limits and transient gateway errors are retried on idempotent requests only.
+        # Server provided `Retry-After` delays are honored but capped since they ignore the request timeout.
+        retries = _CappedRetry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            raise_on_status=False
+        )
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        session = Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def __enter__(self) -> HTTPClient:
+        """Enter the client context."""
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit the client context and release pooled connections."""
+
+        self.close()
 
     @property
     def url(self) -> str:
@@ -40,6 +131,15 @@ class HTTPClient:
 
         return self._url
 
+    def close(self) -> None:
+        """Close the underlying session and release any pooled connections.
+
+        Sessions provided by the caller at init are left open.
+        """
+
+        if self._owns_session:
+            self._session.close()
+
     def login(self, username: str, password: str, timeout: int = DEFAULT_TIMEOUT) -> None:
         """Authenticate a new user session.
 
@@ -52,9 +152,11 @@ class HTTPClient:
             requests.HTTPError: If the login request fails.
         """
 
+        self._auth_valid_until = 0.0
+
         # Prevent HTTP errors raised when authenticating an existing session
-        login_url = self.schema.login.join_url(self.url)
-        response = self._session.post(login_url, json={'username': username, 'password': password}, timeout=timeout)
+        credentials = {'username': username, 'password': password}
+        response = self._session.post(self._login_url, json=credentials, timeout=timeout)
 
         try:
             response.raise_for_status()
@@ -70,37 +172,85 @@ class HTTPClient:
             timeout: Seconds before the blacklist request times out.
         """
 
-        logout_url = self.schema.logout.join_url(self.url)
-        response = self.http_post(logout_url, timeout=timeout)
-        response.raise_for_status()
+        # Without a session cookie there is no server side session to invalidate
+        if not self._session.cookies:
+            return
+
+        self._auth_valid_until = 0.0
+        self.http_post(self._logout_url, timeout=timeout)
 
     def is_authenticated(self, timeout: int = DEFAULT_TIMEOUT) -> bool:
         """Query the server for the current session's authentication status.
 
+        Successful authentication checks are cached for `auth_cache_ttl` seconds.
+        The cache is cleared on login, logout, and when the server rejects a request.
+
         Args:
             timeout: Seconds before the blacklist request times out.
         """
 
-        response = self._session.get(f'{self.url}/authentication/whoami/', timeout=timeout)
+        # Sessions are cookie based, so a client without cookies cannot be authenticated
+        if not self._session.cookies:
+            return False
+
+        now = time.monotonic()
+        if now < self._auth_valid_until:
+            return True
+
+        response = self._session.get(self._whoami_url, timeout=timeout)
         if response.status_code == 401:
             return False
 
         response.raise_for_status()
-        return response.status_code == 200
+        if response.status_code != 200:
+            return False
+
+        self._auth_valid_until = now + self._auth_cache_ttl
+        return True
 
     def _csrf_headers(self) -> dict:
-        """Return the CSRF headers for the current session"""
+        """Return the CSRF headers for the current session
+
+        The returned dictionary is cached between calls and is only rebuilt
+        when the CSRF token changes. It should not be modified by the caller.
+        """
+
+        csrf_token = self._session.cookies.get('csrftoken')
+        if csrf_token != self._csrf_token:
+            self._csrf_token = csrf_token
+            self._csrf_header = {'X-CSRFToken': csrf_token} if csrf_token else {}
+
+        return self._csrf_header
+
+    @staticmethod
+    def _parse_json(response: requests.Response) -> any:
+        """Parse the JSON content of an HTTP response.
+
+        Args:
+            response: The response to parse.
+
+        Returns:
+            The decoded response body.
+
+        Raises:
+            requests.JSONDecodeError: If the response body is not valid JSON.
+        """
+
+        if orjson is None:
+            return response.json()
 
-        headers = dict()
-        if csrf_token := self._session.cookies.get('csrftoken'):
-            headers['X-CSRFToken'] = csrf_token
+        # Match the error raised by `requests` so callers are unaffected by the parser in use
+        try:
+            return orjson.loads(response.content)
 
-        return headers
+        except orjson.JSONDecodeError as e:
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
 
     def _send_request(
         self,
         method: Literal["get", "post", "put", "patch", "delete"],
         endpoint: str,
+        raise_for_status: bool = True,
         **kwargs
     ) -> requests.Response:
         """Send an HTTP request.
@@ -108,7 +258,8 @@ class HTTPClient:
         Args:
             method: The HTTP method to use.
             data: JSON data to include in the POST request.
-            endpoint: The complete url to send the request to.
+            endpoint: An absolute URL or a path relative to the server URL.
+            raise_for_status: Raise an error if the request returns an error code.
             params: Query parameters to include in the request.
             timeout: Seconds before the request times out.
 
@@ -117,10 +268,21 @@ class HTTPClient:
         """
 
         headers = self._csrf_headers()
-        url = urljoin(self.url, endpoint)
+
+        # Absolute URLs (e.g., those resolved by the API schema) are used as is
+        if endpoint.startswith(('http://', 'https://')):
+            url = endpoint
+
+        else:
+            url = self._url + endpoint.lstrip('/')
 
         response = self._session.request(method=method, url=url, headers=headers, **kwargs)
-        response.raise_for_status()
+        if response.status_code in (401, 403):
+            self._auth_valid_until = 0.0
+
+        if raise_for_status:
+            response.raise_for_status()
+
         return response
 
     def http_get(
@@ -232,163 +394,223 @@ class HTTPClient:
         return self._send_request("delete", endpoint, timeout=timeout)
 
 
-class KeystoneClient(HTTPClient):
-    """Client class for submitting requests to the Keystone API."""
+def _create_factory(endpoint_name: str) -> callable:
+    """Factory function for data creation methods.
 
-    @cached_property
-    def api_version(self) -> str:
-        """Return the version number of the API server."""
+    Args:
+        endpoint_name: Name of the endpoint attribute in the client schema.
+    """
 
-        response = self.http_get("version")
-        response.raise_for_status()
-        return response.text
+    def create_record(self: KeystoneClient, **data) -> None:
+        """Create an API record.
 
-    def __new__(cls, *args, **kwargs) -> KeystoneClient:
-        """Dynamically create CRUD methods for each data endpoint in the API schema."""
+        Args:
+            **data: New record values.
 
-        new: KeystoneClient = super().__new__(cls)
+        Returns:
+            A copy of the updated record.
+        """
 
-        new.create_allocation = new._create_factory(cls.schema.allocations)
-        new.retrieve_allocation = new._retrieve_factory(cls.schema.allocations)
-        new.update_allocation = new._update_factory(cls.schema.allocations)
-        new.delete_allocation = new._delete_factory(cls.schema.allocations)
+        url = self._collection_urls[endpoint_name]
+        response = self.http_post(url, data=data)
+        return self._parse_json(response)
 
-        new.create_cluster = new._create_factory(cls.schema.clusters)
-        new.retrieve_cluster = new._retrieve_factory(cls.schema.clusters)
-        new.update_cluster = new._update_factory(cls.schema.clusters)
-        new.delete_cluster = new._delete_factory(cls.schema.clusters)
+    return create_record
 
-        new.create_request = new._create_factory(cls.schema.requests)
-        new.retrieve_request = new._retrieve_factory(cls.schema.requests)
-        new.update_request = new._update_factory(cls.schema.requests)
-        new.delete_request = new._delete_factory(cls.schema.requests)
 
-        new.create_team = new._create_factory(cls.schema.teams)
-        new.retrieve_team = new._retrieve_factory(cls.schema.teams)
-        new.update_team = new._update_factory(cls.schema.teams)
-        new.delete_team = new._delete_factory(cls.schema.teams)
+def _retrieve_factory(endpoint_name: str) -> callable:
+    """Factory function for data retrieval methods.
 
-        new.create_membership = new._create_factory(cls.schema.memberships)
-        new.retrieve_membership = new._retrieve_factory(cls.schema.memberships)
-        new.update_membership = new._update_factory(cls.schema.memberships)
-        new.delete_membership = new._delete_factory(cls.schema.memberships)
+    Args:
+        endpoint_name: Name of the endpoint attribute in the client schema.
+    """
 
-        new.create_user = new._create_factory(cls.schema.users)
-        new.retrieve_user = new._retrieve_factory(cls.schema.users)
-        new.update_user = new._update_factory(cls.schema.users)
-        new.delete_user = new._delete_factory(cls.schema.users)
+    def retrieve_record(
+        self: KeystoneClient,
+        pk: int | None = None,
+        filters: dict | None = None,
+        search: str | None = None,
+        order: str | None = None,
+        timeout=DEFAULT_TIMEOUT
+    ) -> Union[None, dict, list[dict]]:
+        """Retrieve one or more API records.
 
-        return new
+        A single record is returned when specifying a primary key, otherwise the returned
+        object is a list of records. In either case, the return value is `None` when no data
+        is available for the query.
 
-    def _create_factory(self, endpoint: Endpoint) -> callable:
-        """Factory function for data creation methods."""
+        Args:
+            pk: Optional primary key to fetch a specific record.
+            filters: Optional query parameters to include in the request.
+            search: Optionally search records for the given string.
+            order: Optional order returned values by the given parameter.
+            timeout: Seconds before the request times out.
 
-        def create_record(**data) -> None:
-            """Create an API record.
+        Returns:
+            The data record(s) or None.
+        """
 
-            Args:
-                **data: New record values.
+        url = self._collection_urls[endpoint_name]
+        if pk is not None:
+            url = f'{url}{pk}/'
 
-            Returns:
-                A copy of the updated record.
-            """
+        # Copy filters so the caller's dictionary is never modified
+        params = dict(filters) if filters else {}
+        if search is not None:
+            params['_search'] = search
 
-            url = endpoint.join_url(self.url)
-            response = self.http_post(url, data=data)
-            response.raise_for_status()
-            return response.json()
+        if order is not None:
+            params['_order'] = order
 
-        return create_record
+        # Check for missing records before raising to avoid the cost of exception handling
+        response = self._send_request("get", url, raise_for_status=False, params=params, timeout=timeout)
+        if response.status_code == 404:
+            return None
 
-    def _retrieve_factory(self, endpoint: Endpoint) -> callable:
-        """Factory function for data retrieval methods."""
+        response.raise_for_status()
+        return self._parse_json(response)
 
-        def retrieve_record(
-            pk: int | None = None,
-            filters: dict | None = None,
-            search: str | None = None,
-            order: str | None = None,
-            timeout=DEFAULT_TIMEOUT
-        ) -> Union[None, dict, list[dict]]:
-            """Retrieve one or more API records.
+    return retrieve_record
 
-            A single record is returned when specifying a primary key, otherwise the returned
-            object is a list of records. In either case, the return value is `None` when no data
-            is available for the query.
 
-            Args:
-                pk: Optional primary key to fetch a specific record.
-                filters: Optional query parameters to include in the request.
-                search: Optionally search records for the given string.
-                order: Optional order returned values by the given parameter.
-                timeout: Seconds before the request times out.
+def _update_factory(endpoint_name: str) -> callable:
+    """Factory function for data update methods.
 
-            Returns:
-                The data record(s) or None.
-            """
+    Args:
+        endpoint_name: Name of the endpoint attribute in the client schema.
+    """
 
-            url = endpoint.join_url(self.url, pk)
+    def update_record(self: KeystoneClient, pk: int, data) -> dict:
+        """Update an API record.
 
-            for param_name, value in zip(('_search', '_order'), (search, order)):
-                if value is not None:
-                    filters = filters or {}
-                    filters[param_name] = value
+        Args:
+            pk: Primary key of the record to update.
+            data: New record values.
+
+        Returns:
+            A copy of the updated record.
+        """
 
-            try:
-                response = self.http_get(url, params=filters, timeout=timeout)
-                response.raise_for_status()
-                return response.json()
+        url = f'{self._collection_urls[endpoint_name]}{pk}/'
+        response = self.http_patch(url, data=data)
+        return self._parse_json(response)
 
-            except requests.HTTPError as exception:
-                if exception.response.status_code == 404:
-                    return None
+    return update_record
 
-                raise
 
-        return retrieve_record
+def _delete_factory(endpoint_name: str) -> callable:
+    """Factory function for data deletion methods.
+
+    Args:
+        endpoint_name: Name of the endpoint attribute in the client schema.
+    """
 
-    def _update_factory(self, endpoint: Endpoint) -> callable:
-        """Factory function for data update methods."""
+    def delete_record(self: KeystoneClient, pk: int, raise_not_exists: bool = False) -> None:
+        """Delete an API record.
 
-        def update_record(pk: int, data) -> dict:
-            """Update an API record.
+        Args:
+            pk: Primary key of the record to delete.
+            raise_not_exists: Raise an error if the record does not exist.
+        """
 
-            Args:
-                pk: Primary key of the record to update.
-                data: New record values.
+        url = f'{self._collection_urls[endpoint_name]}{pk}/'
 
-            Returns:
-                A copy of the updated record.
-            """
+        response = self._send_request("delete", url, raise_for_status=False, timeout=DEFAULT_TIMEOUT)
+        if response.status_code == 404 and not raise_not_exists:
+            return
 
-            url = endpoint.join_url(self.url, pk)
-            response = self.http_patch(url, data=data)
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
 
-        return update_record
+    return delete_record
 
-    def _delete_factory(self, endpoint: Endpoint) -> callable:
-        """Factory function for data deletion methods."""
 
-        def delete_record(pk: int, raise_not_exists: bool = False) -> None:
-            """Delete an API record.
+def _name_crud_methods(cls: type) -> type:
+    """Class decorator assigning public names to generated CRUD methods.
 
-            Args:
-                pk: Primary key of the record to delete.
-                raise_not_exists: Raise an error if the record does not exist.
-            """
+    This ensures methods built by the CRUD factories are reported under
+    their public names by `help`, `inspect`, and tracebacks.
+    """
 
-            url = endpoint.join_url(self.url, pk)
+    for name, attr in vars(cls).items():
+        if name.startswith(('create_', 'retrieve_', 'update_', 'delete_')) and callable(attr):
+            qualname = f'{cls.__qualname__}.{name}'
+            attr.__name__ = name
+            attr.__qualname__ = qualname
 
-            try:
-                response = self.http_delete(url)
-                response.raise_for_status()
+            # Tracebacks report names from the code object rather than the function
+            if sys.version_info >= (3, 11):
+                attr.__code__ = attr.__code__.replace(co_name=name, co_qualname=qualname)
 
-            except requests.HTTPError as exception:
-                if exception.response.status_code == 404 and not raise_not_exists:
-                    return
+            else:  # pragma: no cover
+                attr.__code__ = attr.__code__.replace(co_name=name)
 
-                raise
+    return cls
+
+
+@_name_crud_methods
+class KeystoneClient(HTTPClient):
+    """Client class for submitting requests to the Keystone API.
+
+    CRUD methods for each data endpoint in the API schema are generated once
+    when the class is defined and are shared by all client instances.
+    Endpoint URLs are resolved from the client `schema` when each client is
+    created, so subclasses may override the schema.
+    """
+
+    create_allocation = _create_factory('allocations')
+    retrieve_allocation = _retrieve_factory('allocations')
+    update_allocation = _update_factory('allocations')
+    delete_allocation = _delete_factory('allocations')
+
+    create_cluster = _create_factory('clusters')
+    retrieve_cluster = _retrieve_factory('clusters')
+    update_cluster = _update_factory('clusters')
+    delete_cluster = _delete_factory('clusters')
+
+    create_request = _create_factory('requests')
+    retrieve_request = _retrieve_factory('requests')
+    update_request = _update_factory('requests')
+    delete_request = _delete_factory('requests')
+
+    create_team = _create_factory('teams')
+    retrieve_team = _retrieve_factory('teams')
+    update_team = _update_factory('teams')
+    delete_team = _delete_factory('teams')
+
+    create_membership = _create_factory('memberships')
+    retrieve_membership = _retrieve_factory('memberships')
+    update_membership = _update_factory('memberships')
+    delete_membership = _delete_factory('memberships')
+
+    create_user = _create_factory('users')
+    retrieve_user = _retrieve_factory('users')
+    update_user = _update_factory('users')
+    delete_user = _delete_factory('users')
+
+    # API versions are cached by server URL and shared across client instances
+    # Each entry stores the version number and the time it was fetched
+    _api_versions: dict[str, tuple[str, float]] = {}
+    api_version_ttl: float = DEFAULT_VERSION_CACHE_TTL
+
+    @property
+    def api_version(self) -> str:
+        """Return the version number of the API server.
+
+        Version numbers are cached for `api_version_ttl` seconds and shared
+        by all clients connected to the same server.
+        """
+
+        now = time.monotonic()
+        cached = self._api_versions.get(self.url)
+        if cached is not None and now - cached[1] < self.api_version_ttl:
+            return cached[0]
+
+        version = self.http_get("version").text
+        self._api_versions[self.url] = (version, now)
+        return version
+
+    @classmethod
+    def clear_api_version_cache(cls) -> None:
+        """Discard cached API version numbers for all servers."""
 
-        return delete_record
+        cls._api_versions.clear()
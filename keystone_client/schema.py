@@ -1,7 +1,6 @@
 """Schema objects used to define available API endpoints."""
 
 from dataclasses import dataclass
-from os import path
 
 
 class Endpoint(str):
@@ -21,11 +20,9 @@ class Endpoint(str):
             The base URL join with the endpoint.
         """
 
-        url = path.join(base, self)
-        for partial_path in filter(lambda x: x is not None, append):
-            url = path.join(url, str(partial_path))
-
-        return url.rstrip('/') + '/'
+        # Join with plain string operations (os.path.join is platform dependent)
+        partial_paths = (str(partial).strip('/') for partial in (self, *append) if partial is not None)
+        return '/'.join((base.rstrip('/'), *filter(None, partial_paths))) + '/'
 
 
 @dataclass
@@ -34,6 +31,7 @@ class Schema:
 
     login = Endpoint('authentication/login')
     logout = Endpoint('authentication/logout')
+    whoami = Endpoint('authentication/whoami')
 
     allocations: Endpoint = Endpoint("allocations/allocations")
     clusters: Endpoint = Endpoint("allocations/clusters")
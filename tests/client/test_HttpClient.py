@@ -1,13 +1,13 @@
 """Test the sending of HTTP requests."""
 
-from unittest import TestCase
+from unittest import skipUnless, TestCase
 from unittest.mock import Mock, patch
 from urllib.parse import urljoin
 
 import requests
 from requests import HTTPError
 
-from keystone_client.client import HTTPClient
+from keystone_client.client import HTTPClient, MAX_RETRY_AFTER, orjson
 from tests import API_HOST, API_PASSWORD, API_USER
 
 
@@ -26,6 +26,80 @@ class Url(TestCase):
         self.assertEqual(expected_url, HTTPClient(base_url + '////').url)
 
 
+class ConnectionPool(TestCase):
+    """Tests for the connection pool backing the client session."""
+
+    def test_shared_adapter(self) -> None:
+        """Test HTTP and HTTPS requests are routed through the same connection adapter."""
+
+        client = HTTPClient('https://test.domain.com')
+        http_adapter = client._session.get_adapter('http://test.domain.com')
+        https_adapter = client._session.get_adapter('https://test.domain.com')
+        self.assertIs(http_adapter, https_adapter)
+
+    def test_pool_size(self) -> None:
+        """Test the connection pool size is configurable at init."""
+
+        client = HTTPClient('https://test.domain.com', pool_size=32)
+        adapter = client._session.get_adapter('https://test.domain.com')
+        self.assertEqual(32, adapter.poolmanager.connection_pool_kw['maxsize'])
+
+    def test_retries_idempotent_requests(self) -> None:
+        """Test rate limits and gateway errors are retried for idempotent requests but not POST requests."""
+
+        client = HTTPClient('https://test.domain.com')
+        retries = client._session.get_adapter('https://test.domain.com').max_retries
+
+        self.assertTrue(retries.is_retry('GET', 503))
+        self.assertFalse(retries.is_retry('POST', 503))
+        self.assertTrue(retries.is_retry('GET', 429))
+        self.assertFalse(retries.is_retry('GET', 404))
+
+    def test_retry_after_header_capped(self) -> None:
+        """Test server provided `Retry-After` delays are honored up to a maximum."""
+
+        client = HTTPClient('https://test.domain.com')
+        retries = client._session.get_adapter('https://test.domain.com').max_retries
+        self.assertTrue(retries.respect_retry_after_header)
+
+        self.assertEqual(2, retries.get_retry_after(Mock(headers={'Retry-After': '2'})))
+        self.assertEqual(MAX_RETRY_AFTER, retries.get_retry_after(Mock(headers={'Retry-After': '3600'})))
+        self.assertIsNone(retries.get_retry_after(Mock(headers={})))
+
+        # Retry policies are copied on each attempt and must keep the cap
+        next_retries = retries.increment('GET', '/')
+        self.assertEqual(MAX_RETRY_AFTER, next_retries.get_retry_after(Mock(headers={'Retry-After': '3600'})))
+
+    def test_custom_session(self) -> None:
+        """Test a user provided session is used without mounting the default adapter."""
+
+        session = requests.Session()
+        default_adapter = session.get_adapter('https://test.domain.com')
+
+        client = HTTPClient('https://test.domain.com', session=session)
+        self.assertIs(session, client._session)
+        self.assertIs(default_adapter, session.get_adapter('https://test.domain.com'))
+
+    def test_custom_session_left_open(self) -> None:
+        """Test closing the client does not close a user provided session."""
+
+        session = Mock(spec=requests.Session)
+        with HTTPClient('https://test.domain.com', session=session):
+            pass
+
+        session.close.assert_not_called()
+
+    @patch('requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close: Mock) -> None:
+        """Test the session is closed when exiting the client context."""
+
+        with HTTPClient('https://test.domain.com') as client:
+            self.assertIsInstance(client, HTTPClient)
+            mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+
+
 class Login(TestCase):
     """Test session authentication via the `login` method."""
 
@@ -101,6 +175,178 @@ class Logout(TestCase):
             self.client.login(API_USER, API_PASSWORD)
 
 
+class LogoutWithoutSession(TestCase):
+    """Test the `logout` method for clients without an existing session."""
+
+    @patch('requests.Session.request')
+    def test_no_request_without_session(self, mock_request: Mock) -> None:
+        """Test no logout request is sent when the client has no session cookies."""
+
+        HTTPClient('https://test.domain.com').logout()
+        mock_request.assert_not_called()
+
+
+class IsAuthenticated(TestCase):
+    """Tests for the `is_authenticated` method."""
+
+    def setUp(self) -> None:
+        """Create a client instance with an existing session cookie."""
+
+        self.client = HTTPClient('https://test.domain.com')
+        self.client._session.cookies.set('sessionid', 'abc')
+
+    @patch('requests.Session.get')
+    def test_whoami_url(self, mock_get: Mock) -> None:
+        """Test the authentication status is queried without duplicate slashes in the URL."""
+
+        mock_get.return_value = Mock(status_code=401)
+
+        self.assertFalse(self.client.is_authenticated(timeout=10))
+        mock_get.assert_called_once_with('https://test.domain.com/authentication/whoami/', timeout=10)
+
+    @patch('requests.Session.get')
+    def test_no_request_without_session(self, mock_get: Mock) -> None:
+        """Test the server is not queried when the client has no session cookies."""
+
+        self.assertFalse(HTTPClient('https://test.domain.com').is_authenticated())
+        mock_get.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_successful_check_cached(self, mock_get: Mock) -> None:
+        """Test a successful authentication check is reused by subsequent calls."""
+
+        mock_get.return_value = Mock(status_code=200)
+
+        self.assertTrue(self.client.is_authenticated())
+        self.assertTrue(self.client.is_authenticated())
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_cache_disabled(self, mock_get: Mock) -> None:
+        """Test authentication checks are not cached when the cache TTL is zero."""
+
+        mock_get.return_value = Mock(status_code=200)
+
+        client = HTTPClient('https://test.domain.com', auth_cache_ttl=0)
+        client._session.cookies.set('sessionid', 'abc')
+        self.assertTrue(client.is_authenticated())
+        self.assertTrue(client.is_authenticated())
+        self.assertEqual(2, mock_get.call_count)
+
+    @patch('requests.Session.get')
+    def test_failed_check_not_cached(self, mock_get: Mock) -> None:
+        """Test a failed authentication check is not reused by subsequent calls."""
+
+        mock_get.return_value = Mock(status_code=401)
+
+        self.assertFalse(self.client.is_authenticated())
+        self.assertFalse(self.client.is_authenticated())
+        self.assertEqual(2, mock_get.call_count)
+
+    @patch('requests.Session.request')
+    @patch('requests.Session.get')
+    def test_cache_cleared_on_rejected_request(self, mock_get: Mock, mock_request: Mock) -> None:
+        """Test the cached authentication status is cleared when the server rejects a request."""
+
+        mock_get.return_value = Mock(status_code=200)
+        mock_request.return_value = Mock(status_code=403)
+
+        self.client.is_authenticated()
+        self.client.http_get('test/endpoint')
+        self.client.is_authenticated()
+        self.assertEqual(2, mock_get.call_count)
+
+
+class CsrfHeaders(TestCase):
+    """Tests for the `_csrf_headers` method."""
+
+    def setUp(self) -> None:
+        """Create a new client instance."""
+
+        self.client = HTTPClient('https://test.domain.com')
+
+    def test_no_csrf_token(self) -> None:
+        """Test no headers are returned when the session has no CSRF token."""
+
+        self.assertEqual({}, self.client._csrf_headers())
+
+    def test_csrf_token_included(self) -> None:
+        """Test the CSRF token is included in the returned headers."""
+
+        self.client._session.cookies.set('csrftoken', 'abc')
+        self.assertEqual({'X-CSRFToken': 'abc'}, self.client._csrf_headers())
+
+    def test_headers_cached(self) -> None:
+        """Test headers are reused until the CSRF token changes."""
+
+        self.client._session.cookies.set('csrftoken', 'abc')
+        headers = self.client._csrf_headers()
+        self.assertIs(headers, self.client._csrf_headers())
+
+        self.client._session.cookies.set('csrftoken', 'xyz')
+        self.assertEqual({'X-CSRFToken': 'xyz'}, self.client._csrf_headers())
+
+
+class ParseJson(TestCase):
+    """Tests for the `_parse_json` method."""
+
+    def setUp(self) -> None:
+        """Create a mock response with JSON content."""
+
+        self.response = Mock(content=b'{"key": [1, 2]}')
+        self.response.json.return_value = {'key': [1, 2]}
+
+    @skipUnless(orjson, 'orjson is not installed')
+    def test_parsed_with_orjson(self) -> None:
+        """Test the response content is decoded when `orjson` is installed."""
+
+        self.assertEqual({'key': [1, 2]}, HTTPClient._parse_json(self.response))
+        self.response.json.assert_not_called()
+
+    @skipUnless(orjson, 'orjson is not installed')
+    def test_invalid_json_with_orjson(self) -> None:
+        """Test invalid content raises the same error as `requests` when `orjson` is installed."""
+
+        self.response.content = b'<html></html>'
+        with self.assertRaises(requests.JSONDecodeError):
+            HTTPClient._parse_json(self.response)
+
+    @patch('keystone_client.client.orjson', None)
+    def test_parsed_without_orjson(self) -> None:
+        """Test the response is decoded by `requests` when `orjson` is not installed."""
+
+        self.assertEqual({'key': [1, 2]}, HTTPClient._parse_json(self.response))
+        self.response.json.assert_called_once()
+
+
+@patch('requests.Session.request')
+class SendRequestUrl(TestCase):
+    """Tests for URL resolution in the `_send_request` method."""
+
+    def setUp(self) -> None:
+        """Create a new client instance."""
+
+        self.client = HTTPClient('https://test.domain.com')
+
+    def test_relative_endpoint(self, mock_request: Mock) -> None:
+        """Test relative endpoints are resolved against the server URL."""
+
+        self.client.http_get('test/endpoint/')
+        self.assertEqual('https://test.domain.com/test/endpoint/', mock_request.call_args.kwargs['url'])
+
+    def test_leading_slash(self, mock_request: Mock) -> None:
+        """Test a leading slash does not produce a duplicate slash in the URL."""
+
+        self.client.http_get('/test/endpoint/')
+        self.assertEqual('https://test.domain.com/test/endpoint/', mock_request.call_args.kwargs['url'])
+
+    def test_absolute_url(self, mock_request: Mock) -> None:
+        """Test absolute URLs are sent unchanged."""
+
+        self.client.http_get('https://other.domain.com/test/endpoint/')
+        self.assertEqual('https://other.domain.com/test/endpoint/', mock_request.call_args.kwargs['url'])
+
+
 @patch('requests.Session.request')
 class BaseHttpMethodTests:
     """Base class for HTTP method tests with common setup and assertions."""
@@ -1,17 +1,31 @@
 """Tests for CRUD operations."""
 
 import re
+import time
+import traceback
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 from requests import HTTPError
 
 from keystone_client import KeystoneClient
+from keystone_client.schema import Endpoint, Schema
 from tests import API_HOST, API_PASSWORD, API_USER
 
 
 class APIVersion(TestCase):
     """Tests for the `api_version` method."""
 
+    def setUp(self) -> None:
+        """Clear any cached API versions."""
+
+        KeystoneClient.clear_api_version_cache()
+
+    def tearDown(self) -> None:
+        """Clear any cached API versions."""
+
+        KeystoneClient.clear_api_version_cache()
+
     def test_version_is_returned(self) -> None:
         """Test a version number is returned."""
 
@@ -30,6 +44,159 @@ class APIVersion(TestCase):
         client = KeystoneClient(API_HOST)
         self.assertRegex(client.api_version, version_regex)
 
+    @patch('requests.Session.request')
+    def test_version_shared_across_instances(self, mock_request: Mock) -> None:
+        """Test the version is only fetched once for clients of the same server."""
+
+        mock_request.return_value = Mock(status_code=200, text='1.2.3')
+
+        self.assertEqual('1.2.3', KeystoneClient(API_HOST).api_version)
+        self.assertEqual('1.2.3', KeystoneClient(API_HOST).api_version)
+        mock_request.assert_called_once()
+
+    @patch('requests.Session.request')
+    def test_version_refreshed_after_ttl(self, mock_request: Mock) -> None:
+        """Test the version is fetched again once the cached value expires."""
+
+        mock_request.return_value = Mock(status_code=200, text='1.2.3')
+        client = KeystoneClient(API_HOST)
+        self.assertEqual('1.2.3', client.api_version)
+
+        mock_request.return_value = Mock(status_code=200, text='2.0.0')
+        with patch('time.monotonic', return_value=time.monotonic() + client.api_version_ttl):
+            self.assertEqual('2.0.0', client.api_version)
+
+    @patch('requests.Session.request')
+    def test_cache_cleared(self, mock_request: Mock) -> None:
+        """Test the version is fetched again after clearing the cache."""
+
+        mock_request.return_value = Mock(status_code=200, text='1.2.3')
+        self.assertEqual('1.2.3', KeystoneClient(API_HOST).api_version)
+
+        mock_request.return_value = Mock(status_code=200, text='2.0.0')
+        KeystoneClient.clear_api_version_cache()
+        self.assertEqual('2.0.0', KeystoneClient(API_HOST).api_version)
+        self.assertEqual(2, mock_request.call_count)
+
+
+class CrudMethods(TestCase):
+    """Tests for the generated CRUD methods."""
+
+    def test_methods_defined_on_class(self) -> None:
+        """Test CRUD methods are shared by the class instead of created per instance."""
+
+        client = KeystoneClient(API_HOST)
+        for method_name in ('create_cluster', 'retrieve_cluster', 'update_cluster', 'delete_cluster'):
+            self.assertNotIn(method_name, vars(client))
+            self.assertTrue(callable(getattr(client, method_name)))
+
+    def test_methods_named(self) -> None:
+        """Test generated CRUD methods are reported under their public names."""
+
+        self.assertEqual('retrieve_cluster', KeystoneClient.retrieve_cluster.__name__)
+        self.assertEqual('KeystoneClient.retrieve_cluster', KeystoneClient.retrieve_cluster.__qualname__)
+
+    @patch('requests.Session.request')
+    def test_traceback_names(self, mock_request: Mock) -> None:
+        """Test tracebacks from generated CRUD methods report their public names."""
+
+        mock_request.return_value = Mock(status_code=500)
+        mock_request.return_value.raise_for_status.side_effect = HTTPError('Server Error')
+
+        # Frames are inspected directly since `assertRaises` clears the traceback
+        try:
+            KeystoneClient(API_HOST).retrieve_cluster()
+
+        except HTTPError as error:
+            frame_names = [frame.name for frame in traceback.extract_tb(error.__traceback__)]
+
+        else:
+            self.fail('HTTPError not raised')
+
+        self.assertIn('retrieve_cluster', frame_names)
+        self.assertNotIn('retrieve_record', frame_names)
+
+    @patch('requests.Session.request')
+    def test_subclass_schema_respected(self, mock_request: Mock) -> None:
+        """Test generated methods use the schema defined by a client subclass."""
+
+        class CustomClient(KeystoneClient):
+            schema = Schema(clusters=Endpoint('v2/clusters'))
+
+        mock_request.return_value = Mock(status_code=200, content=b'{}')
+        mock_request.return_value.json.return_value = {}
+
+        CustomClient('https://test.domain.com').retrieve_cluster(pk=1)
+        self.assertEqual('https://test.domain.com/v2/clusters/1/', mock_request.call_args.kwargs['url'])
+
+    @patch('requests.Session.request')
+    def test_urls_resolved_once(self, mock_request: Mock) -> None:
+        """Test endpoint URLs are resolved when the client is created instead of on each call."""
+
+        mock_request.return_value = Mock(status_code=200, content=b'{}')
+        mock_request.return_value.json.return_value = {}
+        client = KeystoneClient('https://test.domain.com')
+
+        with patch.object(Endpoint, 'join_url') as mock_join_url:
+            client.retrieve_cluster()
+            self.assertEqual('https://test.domain.com/allocations/clusters/', mock_request.call_args.kwargs['url'])
+
+            client.retrieve_cluster(pk=1)
+            self.assertEqual('https://test.domain.com/allocations/clusters/1/', mock_request.call_args.kwargs['url'])
+
+            client.delete_cluster(pk=2)
+            self.assertEqual('https://test.domain.com/allocations/clusters/2/', mock_request.call_args.kwargs['url'])
+
+        mock_join_url.assert_not_called()
+
+    @patch('requests.Session.request')
+    def test_retrieve_filters_not_modified(self, mock_request: Mock) -> None:
+        """Test search and order parameters are not written into the caller's filters."""
+
+        mock_request.return_value = Mock(status_code=200, content=b'[]')
+        mock_request.return_value.json.return_value = []
+
+        filters = {'name': 'Test-Cluster'}
+        KeystoneClient(API_HOST).retrieve_cluster(filters=filters, search='foo', order='name')
+
+        self.assertEqual({'name': 'Test-Cluster'}, filters)
+        self.assertEqual(
+            {'name': 'Test-Cluster', '_search': 'foo', '_order': 'name'},
+            mock_request.call_args.kwargs['params']
+        )
+
+
+@patch('requests.Session.request')
+class MissingRecords(TestCase):
+    """Test the handling of `404` responses by the generated CRUD methods."""
+
+    def setUp(self) -> None:
+        """Create a mock `404` response."""
+
+        self.mock_response = Mock(status_code=404)
+        self.mock_response.raise_for_status.side_effect = HTTPError('Not Found')
+
+    def test_retrieve_returns_none(self, mock_request: Mock) -> None:
+        """Test `None` is returned without raising an error when a record does not exist."""
+
+        mock_request.return_value = self.mock_response
+        self.assertIsNone(KeystoneClient(API_HOST).retrieve_cluster(pk=1))
+        self.mock_response.raise_for_status.assert_not_called()
+
+    def test_delete_exits_silently(self, mock_request: Mock) -> None:
+        """Test deleting a missing record exits without raising an error."""
+
+        mock_request.return_value = self.mock_response
+        KeystoneClient(API_HOST).delete_cluster(pk=1)
+        self.mock_response.raise_for_status.assert_not_called()
+
+    def test_delete_raises_when_specified(self, mock_request: Mock) -> None:
+        """Test deleting a missing record raises an error when `raise_not_exists` is set."""
+
+        mock_request.return_value = self.mock_response
+        with self.assertRaises(HTTPError):
+            KeystoneClient(API_HOST).delete_cluster(pk=1, raise_not_exists=True)
+
 
 class Create(TestCase):
     """Test record creation via the `create_cluster` method."""
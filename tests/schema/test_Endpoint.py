@@ -40,6 +40,14 @@ class JoinUrl(TestCase):
         expected_result = "https://api.example.com/authentication/new/"
         self.assertEqual(expected_result, endpoint.join_url(base_url))
 
+    def test_with_endpoint_leading_slash(self) -> None:
+        """Test `join_url` with an endpoint that has a leading slash."""
+
+        endpoint = Endpoint("/authentication/new")
+        base_url = "https://api.example.com"
+        expected_result = "https://api.example.com/authentication/new/"
+        self.assertEqual(expected_result, endpoint.join_url(base_url))
+
     def test_with_append_trailing_slash(self) -> None:
         endpoint = Endpoint("authentication")
         base_url = "https://api.example.com"